@@ -5,21 +5,22 @@ Provides functionality to manage and search datasets.
 """
 
 from typing import Any
+import asyncio
+import functools
 import os
 import logging
-from pathlib import Path
-import sys
-
-# Add the parent src directory to the Python path
-current_dir = Path(__file__).parent
-parent_src = current_dir.parent.parent / "src"
-sys.path.insert(0, str(parent_src))
+import threading
+import time
+from collections import ChainMap
+from types import MappingProxyType
 
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# pandas is imported by the helpers that need it, on first use, to keep
+# server start-up fast
+
+# Logging is configured by main(), leaving importers' configuration alone
 logger = logging.getLogger(__name__)
 
 # Load environment variables
@@ -29,25 +30,362 @@ load_dotenv()
 mcp = FastMCP("visual-layer")
 
 # Constants
-VISUAL_LAYER_API_KEY = os.getenv("VISUAL_LAYER_API_KEY")
-VISUAL_LAYER_API_SECRET = os.getenv("VISUAL_LAYER_API_SECRET")
-
-
+DATASET_CACHE_TTL_S = 60
+DATASET_CACHE_MAXSIZE = 128
+REQUEST_CONCURRENCY = 8
+CATEGORICAL_DATASET_COLUMNS = ("status", "type")
+
+# Search operators accepted by search_by_labels, in display order
+SEARCH_OPERATOR_NAMES = ("IS", "IS_NOT", "IS_ONE_OF", "IS_NOT_ONE_OF")
+VALID_SEARCH_OPERATORS = frozenset(SEARCH_OPERATOR_NAMES)
+
+# (label, column, default) for each line of a formatted dataset
+DATASET_LIST_FIELDS = (
+    ("ID", "id", "N/A"),
+    ("Name", "display_name", "N/A"),
+    ("Description", "description", "No description available"),
+    ("Created", "created_at", "N/A"),
+    ("Status", "status", "N/A"),
+)
+DATASET_MATCH_FIELDS = (
+    ("ID", "id", "N/A"),
+    ("Name", "name", "N/A"),
+    ("Description", "description", "No description available"),
+    ("Type", "type", "N/A"),
+    ("Status", "status", "N/A"),
+)
+
+# Response templates
+HEALTH_CHECK_TEMPLATE = """
+Visual Layer API Health Check:
+Status: {status}
+Message: API is healthy and responding
+"""
+DATASET_INFO_TEMPLATE = """
+Dataset Information:
+ID: {id}
+Name: {name}
+Description: {description}
+Created: {created_at}
+Status: {status}
+Type: {type}
+Size: {size}
+"""
+DATASET_INFO_DEFAULTS = MappingProxyType(
+    {
+        "id": "N/A",
+        "name": "N/A",
+        "description": "No description available",
+        "created_at": "N/A",
+        "status": "N/A",
+        "type": "N/A",
+        "size": "N/A",
+    }
+)
+
+# Dataset metadata caches, refreshed once entries are older than the TTL
+_datasets_cache = {"df": None, "ts": 0.0, "label_text": None, "listing": None}
+_dataset_cache = {}
+_dataset_cache_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
 def get_client():
-    """Get the Visual Layer client with proper error handling."""
-    if not VISUAL_LAYER_API_KEY or not VISUAL_LAYER_API_SECRET:
+    """Get the Visual Layer client with proper error handling.
+
+    The client is created once and reused across tool calls. Credentials are
+    read from the environment when the client is created, so calling
+    invalidate_client() after rotating them picks up the new values.
+    """
+    api_key = os.getenv("VISUAL_LAYER_API_KEY")
+    api_secret = os.getenv("VISUAL_LAYER_API_SECRET")
+    if not api_key or not api_secret:
         raise ValueError(
             "API credentials not found. Please set VISUAL_LAYER_API_KEY and VISUAL_LAYER_API_SECRET"
         )
 
     try:
+        # Imported on first use to keep server start-up fast
         from visual_layer_sdk.client import VisualLayerClient
 
-        return VisualLayerClient(VISUAL_LAYER_API_KEY, VISUAL_LAYER_API_SECRET)
+        return VisualLayerClient(api_key, api_secret)
     except Exception as e:
         raise RuntimeError(f"Failed to initialize Visual Layer client: {e}")
 
 
+@functools.lru_cache(maxsize=1)
+def get_search_operator_map():
+    """Get the mapping from operator names to SearchOperator enum members.
+
+    Built on the first label search, which also imports the SDK.
+    """
+    from visual_layer_sdk.dataset import SearchOperator
+
+    return MappingProxyType(
+        {
+            "IS": SearchOperator.IS,
+            "IS_NOT": SearchOperator.IS_NOT,
+            "IS_ONE_OF": SearchOperator.IS_ONE_OF,
+            "IS_NOT_ONE_OF": SearchOperator.IS_NOT_ONE_OF,
+        }
+    )
+
+
+def invalidate_client():
+    """Drop the cached Visual Layer client so the next call creates a new one.
+
+    Cached dataset metadata is dropped too, as it may belong to the account of
+    the previous credentials.
+    """
+    get_client.cache_clear()
+    invalidate_dataset_cache()
+
+
+def get_all_datasets_cached(client):
+    """Get the datasets DataFrame, reusing a recent result when available."""
+    now = time.monotonic()
+    if (
+        _datasets_cache["df"] is None
+        or now - _datasets_cache["ts"] > DATASET_CACHE_TTL_S
+    ):
+        datasets_df = client.get_all_datasets()
+        # Low-cardinality text columns are much smaller as categoricals
+        for col in CATEGORICAL_DATASET_COLUMNS:
+            if col in datasets_df:
+                datasets_df[col] = datasets_df[col].astype("category")
+        _datasets_cache.update(df=datasets_df, ts=now, label_text=None, listing=None)
+    return _datasets_cache["df"]
+
+
+def get_dataset_cached(client, dataset_id: str):
+    """Get a single dataset, reusing a recent result when available."""
+    now = time.monotonic()
+    entry = _dataset_cache.get(dataset_id)
+    if entry is None or now - entry[0] > DATASET_CACHE_TTL_S:
+        entry = (now, client.get_dataset(dataset_id))
+        # Lookups may run in worker threads, so guard the eviction
+        with _dataset_cache_lock:
+            # Re-insert refreshed entries so insertion order follows age
+            _dataset_cache.pop(dataset_id, None)
+            # Evict the oldest entry once the cache is full
+            if len(_dataset_cache) >= DATASET_CACHE_MAXSIZE:
+                _dataset_cache.pop(next(iter(_dataset_cache)))
+            _dataset_cache[dataset_id] = entry
+    return entry[1]
+
+
+def get_dataset_label_text(datasets_df):
+    """Get the lowercased text that label queries are matched against.
+
+    Combines various fields that might contain label information for all rows
+    at once. The result is kept alongside the cached datasets DataFrame so
+    repeated queries reuse it.
+    """
+    if (
+        datasets_df is _datasets_cache["df"]
+        and _datasets_cache["label_text"] is not None
+    ):
+        return _datasets_cache["label_text"]
+
+    label_fields = (
+        datasets_df.reindex(columns=["name", "description", "type"])
+        .astype("string")
+        .fillna("")
+    )
+    label_text = (
+        label_fields["name"]
+        + " "
+        + label_fields["description"]
+        + " "
+        + label_fields["type"]
+    ).str.lower()
+
+    if datasets_df is _datasets_cache["df"]:
+        _datasets_cache["label_text"] = label_text
+    return label_text
+
+
+def get_dataset_listing(datasets_df):
+    """Get the formatted blocks for every dataset in the listing.
+
+    Defaults are filled and the text is built once per cached datasets
+    DataFrame, then reused by later calls.
+    """
+    if datasets_df is _datasets_cache["df"] and _datasets_cache["listing"] is not None:
+        return _datasets_cache["listing"]
+
+    listing = format_datasets(datasets_df, DATASET_LIST_FIELDS)
+
+    if datasets_df is _datasets_cache["df"]:
+        _datasets_cache["listing"] = listing
+    return listing
+
+
+def invalidate_dataset_cache():
+    """Drop all cached dataset metadata."""
+    _datasets_cache.update(df=None, ts=0.0, label_text=None, listing=None)
+    _dataset_cache.clear()
+
+
+def format_datasets(datasets_df, fields):
+    """Format each dataset as a text block, one line per field.
+
+    The text is assembled column-wise with pandas string operations rather
+    than row by row.
+
+    Args:
+        datasets_df: DataFrame of datasets to format
+        fields: (label, column, default) tuples in display order
+    """
+    import pandas as pd
+
+    # Fill on object columns, as categoricals reject unknown fill values
+    display_df = (
+        datasets_df.reindex(columns=[column for _, column, _ in fields])
+        .astype(object)
+        .fillna({column: default for _, column, default in fields})
+    )
+
+    numbers = pd.Series(range(1, len(display_df) + 1), index=display_df.index)
+    formatted = "\nDataset " + numbers.astype(str) + ":\n"
+    for label, column, _ in fields:
+        formatted = formatted + f"{label}: " + display_df[column].astype(str) + "\n"
+
+    return formatted.tolist()
+
+
+def format_dataset_info(dataset_info):
+    """Format the details of a single dataset.
+
+    Returns None if there is no dataset information.
+    """
+    # Convert the first row to a dict if it's a DataFrame
+    if hasattr(dataset_info, "iloc"):
+        dataset_info = dataset_info.iloc[0].to_dict() if len(dataset_info) > 0 else {}
+
+    if not dataset_info:
+        return None
+
+    return DATASET_INFO_TEMPLATE.format_map(
+        ChainMap(dataset_info, DATASET_INFO_DEFAULTS)
+    )
+
+
+def search_dataset_by_labels(client, dataset_id: str, labels, search_op):
+    """Run a label search within a single dataset and return the results."""
+    dataset = client.get_dataset_object(dataset_id)
+
+    # Use the Searchable interface for label search
+    searchable = dataset.search()
+    searchable = searchable.search_by_labels(labels, search_operator=search_op)
+
+    # Get the results
+    return searchable.get_results()
+
+
+async def gather_in_threads(func, items):
+    """Call a blocking function on each item concurrently in worker threads.
+
+    At most REQUEST_CONCURRENCY calls run at once. Results are returned in
+    item order, with exceptions returned in place of the failed results. These
+    may include asyncio.CancelledError, which is not an Exception subclass.
+    """
+    semaphore = asyncio.Semaphore(REQUEST_CONCURRENCY)
+
+    async def call(item):
+        async with semaphore:
+            return await asyncio.to_thread(func, item)
+
+    return await asyncio.gather(*(call(item) for item in items), return_exceptions=True)
+
+
+async def search_datasets_by_labels(client, dataset_ids, labels, search_op):
+    """Run a label search in several datasets concurrently.
+
+    Returns the combined results with a leading ``dataset_id`` column, and a
+    dict mapping the ID of each dataset whose search failed to its exception.
+    """
+    import pandas as pd
+
+    results = await gather_in_threads(
+        functools.partial(
+            search_dataset_by_labels, client, labels=labels, search_op=search_op
+        ),
+        dataset_ids,
+    )
+
+    frames = []
+    failures = {}
+    for dataset_id, result in zip(dataset_ids, results):
+        # Cancellation is not a search failure, so let it propagate
+        if isinstance(result, asyncio.CancelledError):
+            raise result
+        if isinstance(result, BaseException):
+            logger.warning("Label search failed for dataset %s: %s", dataset_id, result)
+            failures[dataset_id] = result
+            continue
+        if result.empty:
+            continue
+        if "dataset_id" not in result.columns:
+            result = result.copy()
+            result.insert(0, "dataset_id", dataset_id)
+        frames.append(result)
+
+    if not frames:
+        return pd.DataFrame(), failures
+    return pd.concat(frames, ignore_index=True), failures
+
+
+def format_search_results(results_df):
+    """Format label search results, showing all available columns.
+
+    Returns the column Index and one formatted string per result.
+    """
+    import pandas as pd
+
+    # Truncate very long values for readability, one text column at a time
+    # Columns are handled by position, as labels may be duplicated
+    results_df = results_df.copy(deep=False)
+    for position, dtype in enumerate(results_df.dtypes):
+        if not (
+            pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)
+        ):
+            continue
+        values = results_df.iloc[:, position]
+        if pd.api.types.infer_dtype(values, skipna=True) == "string":
+            text = values
+        else:
+            # Mixed columns: only the str cells are truncated
+            is_text = values.map(lambda value: isinstance(value, str))
+            if not is_text.any():
+                continue
+            text = values.where(is_text)
+        too_long = text.str.len() > 200
+        if too_long.any():
+            # isetitem replaces the column, leaving the caller's data untouched
+            results_df.isetitem(
+                position, values.mask(too_long, text.str.slice(0, 200) + "...")
+            )
+
+    # Show all available columns in the results, using the Index as is
+    available_columns = results_df.columns
+
+    # Format the results - show all available data
+    formatted_results = []
+    # itertuples yields plain tuples, avoiding a Series per row;
+    # values are accessed positionally since column names may not
+    # be valid identifiers
+    for i, row in enumerate(results_df.itertuples(index=False, name=None), 1):
+        parts = [f"\nResult {i}:\n"]
+        # Add all available columns
+        for col, value in zip(available_columns, row):
+            parts.append(f"{col}: {value}\n")
+
+        formatted_results.append("".join(parts))
+
+    return available_columns, formatted_results
+
+
 @mcp.tool()
 async def get_all_datasets() -> str:
     """Get a list of all available datasets.
@@ -56,26 +394,15 @@ async def get_all_datasets() -> str:
     """
     try:
         client = get_client()
-        datasets_df = client.get_all_datasets()
-        datasets_list = datasets_df.to_dict("records")
+        datasets_df = get_all_datasets_cached(client)
 
-        if not datasets_list:
+        if datasets_df.empty:
             return "No datasets found."
 
         # Format the datasets into a readable format
-        formatted_datasets = []
-        for i, dataset in enumerate(datasets_list, 1):
-            formatted_dataset = f"""
-Dataset {i}:
-ID: {dataset.get('id', 'N/A')}
-Name: {dataset.get('display_name', 'N/A')}
-Description: {dataset.get('description', 'No description available')}
-Created: {dataset.get('created_at', 'N/A')}
-Status: {dataset.get('status', 'N/A')}
-"""
-            formatted_datasets.append(formatted_dataset)
+        formatted_datasets = get_dataset_listing(datasets_df)
 
-        return f"Found {len(datasets_list)} datasets:\n" + "\n---\n".join(
+        return f"Found {len(datasets_df)} datasets:\n" + "\n---\n".join(
             formatted_datasets
         )
 
@@ -93,16 +420,22 @@ async def health_check() -> str:
         client = get_client()
         health_status = client.healthcheck()
 
-        return f"""
-Visual Layer API Health Check:
-Status: {health_status}
-Message: API is healthy and responding
-"""
+        return HEALTH_CHECK_TEMPLATE.format(status=health_status)
 
     except Exception as e:
         return f"Health check failed: {str(e)}"
 
 
+@mcp.tool()
+async def clear_cache() -> str:
+    """Clear cached dataset metadata.
+
+    Forces the next dataset lookups to fetch fresh data from Visual Layer.
+    """
+    invalidate_dataset_cache()
+    return "Dataset cache cleared."
+
+
 @mcp.tool()
 async def get_dataset_info(dataset_id: str) -> str:
     """Get detailed information about a specific dataset.
@@ -112,34 +445,65 @@ async def get_dataset_info(dataset_id: str) -> str:
     """
     try:
         client = get_client()
-        dataset_info = client.get_dataset(dataset_id)
+        formatted_info = format_dataset_info(get_dataset_cached(client, dataset_id))
 
-        # Convert to dict if it's a DataFrame
-        if hasattr(dataset_info, "to_dict"):
-            dataset_info = (
-                dataset_info.to_dict("records")[0] if len(dataset_info) > 0 else {}
-            )
-
-        if not dataset_info:
+        if formatted_info is None:
             return f"No dataset found with ID: {dataset_id}"
 
-        formatted_info = f"""
-Dataset Information:
-ID: {dataset_info.get('id', 'N/A')}
-Name: {dataset_info.get('name', 'N/A')}
-Description: {dataset_info.get('description', 'No description available')}
-Created: {dataset_info.get('created_at', 'N/A')}
-Status: {dataset_info.get('status', 'N/A')}
-Type: {dataset_info.get('type', 'N/A')}
-Size: {dataset_info.get('size', 'N/A')}
-"""
-
         return formatted_info
 
     except Exception as e:
         return f"Error getting dataset info: {str(e)}"
 
 
+@mcp.tool()
+async def get_datasets_info(dataset_ids: list[str]) -> str:
+    """Get detailed information about several datasets at once.
+
+    The datasets are fetched concurrently.
+
+    Args:
+        dataset_ids: The IDs of the datasets to get information about
+    """
+    try:
+        # Drop duplicate IDs while keeping their order
+        dataset_ids = list(dict.fromkeys(dataset_ids))
+        if not dataset_ids:
+            return "No dataset IDs provided."
+
+        client = get_client()
+        results = await gather_in_threads(
+            functools.partial(get_dataset_cached, client), dataset_ids
+        )
+
+        found = 0
+        formatted_results = []
+        for dataset_id, result in zip(dataset_ids, results):
+            # Cancellation is not a lookup failure, so let it propagate
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, BaseException):
+                formatted_results.append(
+                    f"\nError getting dataset info for {dataset_id}: {str(result)}\n"
+                )
+                continue
+
+            formatted_info = format_dataset_info(result)
+            if formatted_info is None:
+                formatted_results.append(f"\nNo dataset found with ID: {dataset_id}\n")
+                continue
+
+            found += 1
+            formatted_results.append(formatted_info)
+
+        return f"Found {found} of {len(dataset_ids)} datasets:\n" + "\n---\n".join(
+            formatted_results
+        )
+
+    except Exception as e:
+        return f"Error getting datasets info: {str(e)}"
+
+
 @mcp.tool()
 async def search_by_labels(
     label_query: str, dataset_id: str = None, search_operator: str = "IS_ONE_OF"
@@ -148,72 +512,35 @@ async def search_by_labels(
 
     Args:
         label_query: The label or text to search for in dataset labels
-        dataset_id: Optional specific dataset ID to search within. If not provided, searches across all datasets.
+        dataset_id: Optional specific dataset ID to search within. If not provided, searches across all datasets concurrently and falls back to matching dataset names, descriptions and types.
         search_operator: Search operator to use. Options: "IS", "IS_NOT", "IS_ONE_OF", "IS_NOT_ONE_OF"
     """
     try:
         client = get_client()
 
         # Validate search operator
-        valid_operators = ["IS", "IS_NOT", "IS_ONE_OF", "IS_NOT_ONE_OF"]
-        if search_operator not in valid_operators:
-            return f"Invalid search operator '{search_operator}'. Valid options are: {', '.join(valid_operators)}"
+        if search_operator not in VALID_SEARCH_OPERATORS:
+            return f"Invalid search operator '{search_operator}'. Valid options are: {', '.join(SEARCH_OPERATOR_NAMES)}"
+
+        search_op = get_search_operator_map()[search_operator]
+
+        # Handle single label vs multiple labels
+        if isinstance(label_query, str):
+            labels = [label_query]
+        else:
+            labels = label_query
 
         if dataset_id:
             # Search within a specific dataset
             try:
-                dataset = client.get_dataset_object(dataset_id)
-
-                # Import SearchOperator enum
-                from visual_layer_sdk.dataset import SearchOperator
-
-                # Map string to SearchOperator enum
-                operator_map = {
-                    "IS": SearchOperator.IS,
-                    "IS_NOT": SearchOperator.IS_NOT,
-                    "IS_ONE_OF": SearchOperator.IS_ONE_OF,
-                    "IS_NOT_ONE_OF": SearchOperator.IS_NOT_ONE_OF,
-                }
-
-                search_op = operator_map[search_operator]
-
-                # Use the Searchable interface for label search
-                searchable = dataset.search()
-
-                # Handle single label vs multiple labels
-                if isinstance(label_query, str):
-                    labels = [label_query]
-                else:
-                    labels = label_query
-
-                searchable = searchable.search_by_labels(
-                    labels, search_operator=search_op
+                results_df = search_dataset_by_labels(
+                    client, dataset_id, labels, search_op
                 )
 
-                # Get the results
-                results_df = searchable.get_results()
-
                 if results_df.empty:
                     return f"No images found with label '{label_query}' using operator '{search_operator}' in dataset {dataset_id}"
 
-                # Show all available columns in the results
-                available_columns = list(results_df.columns)
-
-                # Format the results - show all available data
-                formatted_results = []
-                for i, (idx, row) in enumerate(results_df.iterrows(), 1):
-                    formatted_result = f"""
-Result {i}:
-"""
-                    # Add all available columns
-                    for col in available_columns:
-                        value = row.get(col, "N/A")
-                        # Truncate very long values for readability
-                        if isinstance(value, str) and len(value) > 200:
-                            value = value[:200] + "..."
-                        formatted_result += f"{col}: {value}\n"
-
-                    formatted_results.append(formatted_result)
+                available_columns, formatted_results = format_search_results(results_df)
 
                 return (
                     f"Found {len(results_df)} images with label '{label_query}' using operator '{search_operator}' in dataset {dataset_id}.\n\nAvailable columns: {', '.join(available_columns)}\n\nResults:\n"
@@ -224,38 +551,53 @@ Result {i}:
                 return f"Error searching dataset {dataset_id}: {str(e)}"
         else:
             # Search across all datasets
-            datasets_df = client.get_all_datasets()
-            datasets_list = datasets_df.to_dict("records")
+            datasets_df = get_all_datasets_cached(client)
 
-            if not datasets_list:
+            if datasets_df.empty:
                 return "No datasets found to search through."
 
-            # Search through datasets for matching labels
-            matching_datasets = []
-            for dataset in datasets_list:
-                # Check various fields that might contain label information
-                dataset_text = f"{dataset.get('name', '')} {dataset.get('description', '')} {dataset.get('type', '')}".lower()
-                if label_query.lower() in dataset_text:
-                    matching_datasets.append(dataset)
-
-            if not matching_datasets:
-                return f"No datasets found matching the label query: '{label_query}'"
-
-            # Format the matching datasets
-            formatted_results = []
-            for i, dataset in enumerate(matching_datasets, 1):
-                formatted_dataset = f"""
-Dataset {i}:
-ID: {dataset.get('id', 'N/A')}
-Name: {dataset.get('name', 'N/A')}
-Description: {dataset.get('description', 'No description available')}
-Type: {dataset.get('type', 'N/A')}
-Status: {dataset.get('status', 'N/A')}
-"""
-                formatted_results.append(formatted_dataset)
+            # Run the label search in every dataset concurrently
+            failure_note = ""
+            if "id" in datasets_df:
+                dataset_ids = datasets_df["id"].dropna().tolist()
+                results_df, failures = await search_datasets_by_labels(
+                    client, dataset_ids, labels, search_op
+                )
+                if dataset_ids and len(failures) == len(dataset_ids):
+                    first_error = next(iter(failures.values()))
+                    return f"Error searching datasets by labels: the label search failed in all {len(dataset_ids)} datasets ({str(first_error)})"
+                if failures:
+                    failure_note = f"{len(failures)} datasets could not be searched: {', '.join(map(str, failures))}\n"
+
+                if not results_df.empty:
+                    available_columns, formatted_results = format_search_results(
+                        results_df
+                    )
+                    return (
+                        f"Found {len(results_df)} images with label '{label_query}' using operator '{search_operator}' across all datasets.\n{failure_note}\nAvailable columns: {', '.join(available_columns)}\n\nResults:\n"
+                        + "\n---\n".join(formatted_results)
+                    )
+
+            # Fall back to matching the label query against dataset metadata
+            dataset_text = get_dataset_label_text(datasets_df)
+            mask = dataset_text.str.contains(label_query.lower(), regex=False)
+
+            if not mask.any():
+                return (
+                    f"No datasets found matching the label query: '{label_query}'"
+                    + (f"\n{failure_note}" if failure_note else "")
+                )
+
+            # Format the matching datasets, copying only the displayed columns
+            display_columns = datasets_df.columns.intersection(
+                [column for _, column, _ in DATASET_MATCH_FIELDS]
+            )
+            matching_datasets = datasets_df.loc[mask, display_columns]
+            formatted_results = format_datasets(matching_datasets, DATASET_MATCH_FIELDS)
 
             return (
                 f"Found {len(matching_datasets)} datasets matching '{label_query}':\n"
+                + failure_note
                 + "\n---\n".join(formatted_results)
             )
 
@@ -265,6 +607,15 @@ Status: {dataset.get('status', 'N/A')}
 
 def main():
     """Main entry point for the MCP server."""
+    # Configure logging
+    level_name = os.getenv("LOG_LEVEL", "INFO").upper()
+    level = logging.getLevelName(level_name)
+    if isinstance(level, int):
+        logging.basicConfig(level=level)
+    else:
+        logging.basicConfig(level=logging.INFO)
+        logger.warning("Unknown LOG_LEVEL %r, using INFO", level_name)
+
     # Initialize and run the server
     mcp.run(transport="stdio")
 
@@ -0,0 +1,110 @@
+"""
+Shared fixtures for the Visual Layer MCP server tests, using a stubbed client.
+"""
+
+import pandas as pd
+import pytest
+
+from mcp_server import server
+
+
+class StubSearchable:
+    def __init__(self, client, dataset_id):
+        self.client = client
+        self.dataset_id = dataset_id
+
+    def search_by_labels(self, labels, search_operator):
+        return self
+
+    def get_results(self):
+        result = self.client.search_results[self.dataset_id]
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+
+class StubDataset:
+    def __init__(self, client, dataset_id):
+        self.client = client
+        self.dataset_id = dataset_id
+
+    def search(self):
+        return StubSearchable(self.client, self.dataset_id)
+
+
+class StubClient:
+    """Stand-in for VisualLayerClient that counts API calls."""
+
+    def __init__(self, datasets_df=None, datasets=None, search_results=None):
+        self.datasets_df = datasets_df if datasets_df is not None else pd.DataFrame()
+        self.datasets = datasets or {}
+        self.search_results = search_results or {}
+        self.calls = {"get_all_datasets": 0, "get_dataset": 0}
+
+    def get_all_datasets(self):
+        self.calls["get_all_datasets"] += 1
+        return self.datasets_df.copy()
+
+    def get_dataset(self, dataset_id):
+        self.calls["get_dataset"] += 1
+        dataset = self.datasets.get(dataset_id)
+        if isinstance(dataset, BaseException):
+            raise dataset
+        if dataset is None:
+            return pd.DataFrame()
+        return pd.DataFrame([dataset])
+
+    def get_dataset_object(self, dataset_id):
+        return StubDataset(self, dataset_id)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    server.invalidate_dataset_cache()
+    yield
+    server.invalidate_dataset_cache()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.monotonic."""
+    now = [1000.0]
+    monkeypatch.setattr(server.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def use_client(monkeypatch):
+    """Install a StubClient built from the given arguments as the client."""
+
+    def install(**kwargs):
+        client = StubClient(**kwargs)
+
+        def get_client():
+            return client
+
+        # Mirror the lru_cache interface used by invalidate_client()
+        get_client.cache_clear = lambda: None
+        monkeypatch.setattr(server, "get_client", get_client)
+        monkeypatch.setattr(
+            server,
+            "get_search_operator_map",
+            lambda: {name: name for name in server.SEARCH_OPERATOR_NAMES},
+        )
+        return client
+
+    return install
+
+
+@pytest.fixture
+def datasets_df():
+    return pd.DataFrame(
+        {
+            "id": ["ds1", "ds2"],
+            "display_name": ["Cats", "Dogs"],
+            "name": ["cats", "dogs"],
+            "description": ["Pictures of cats", None],
+            "type": ["images", "images"],
+            "status": ["READY", "READY"],
+        }
+    )
@@ -0,0 +1,55 @@
+"""
+Tests for creating and invalidating the Visual Layer client.
+"""
+
+import sys
+import types
+
+import pytest
+
+from mcp_server import server
+
+
+class FakeVisualLayerClient:
+    def __init__(self, api_key, api_secret):
+        self.api_key = api_key
+        self.api_secret = api_secret
+
+
+@pytest.fixture
+def fake_sdk(monkeypatch):
+    """Provide a visual_layer_sdk.client module with a fake client class."""
+    client_module = types.ModuleType("visual_layer_sdk.client")
+    client_module.VisualLayerClient = FakeVisualLayerClient
+    monkeypatch.setitem(sys.modules, "visual_layer_sdk", types.ModuleType("sdk"))
+    monkeypatch.setitem(sys.modules, "visual_layer_sdk.client", client_module)
+    server.get_client.cache_clear()
+    yield
+    server.get_client.cache_clear()
+
+
+class TestInvalidateClient:
+    def test_rotated_credentials_are_used(self, monkeypatch, fake_sdk):
+        monkeypatch.setenv("VISUAL_LAYER_API_KEY", "old-key")
+        monkeypatch.setenv("VISUAL_LAYER_API_SECRET", "old-secret")
+        first = server.get_client()
+        assert server.get_client() is first
+
+        monkeypatch.setenv("VISUAL_LAYER_API_KEY", "new-key")
+        monkeypatch.setenv("VISUAL_LAYER_API_SECRET", "new-secret")
+        server.invalidate_client()
+        second = server.get_client()
+
+        assert second is not first
+        assert (second.api_key, second.api_secret) == ("new-key", "new-secret")
+
+    def test_drops_cached_dataset_metadata(self, use_client, datasets_df):
+        client = use_client(datasets_df=datasets_df, datasets={"ds1": {"id": "ds1"}})
+        server.get_all_datasets_cached(client)
+        server.get_dataset_cached(client, "ds1")
+
+        server.invalidate_client()
+        server.get_all_datasets_cached(client)
+        server.get_dataset_cached(client, "ds1")
+
+        assert client.calls == {"get_all_datasets": 2, "get_dataset": 2}
@@ -0,0 +1,68 @@
+"""
+Tests for the dataset metadata caches.
+"""
+
+from mcp_server import server
+
+
+class TestDatasetCache:
+    async def test_get_all_datasets_reuses_cached_result(
+        self, use_client, clock, datasets_df
+    ):
+        client = use_client(datasets_df=datasets_df)
+
+        first = await server.get_all_datasets()
+        clock[0] += server.DATASET_CACHE_TTL_S - 1
+        second = await server.get_all_datasets()
+
+        assert first == second
+        assert "Found 2 datasets" in first
+        assert "Description: No description available" in first
+        assert client.calls["get_all_datasets"] == 1
+
+    async def test_get_all_datasets_refetches_after_ttl(
+        self, use_client, clock, datasets_df
+    ):
+        client = use_client(datasets_df=datasets_df)
+
+        await server.get_all_datasets()
+        clock[0] += server.DATASET_CACHE_TTL_S + 1
+        await server.get_all_datasets()
+
+        assert client.calls["get_all_datasets"] == 2
+
+    async def test_get_dataset_info_cache_expiry(self, use_client, clock):
+        client = use_client(datasets={"ds1": {"id": "ds1"}})
+
+        await server.get_dataset_info("ds1")
+        await server.get_dataset_info("ds1")
+        assert client.calls["get_dataset"] == 1
+
+        clock[0] += server.DATASET_CACHE_TTL_S + 1
+        await server.get_dataset_info("ds1")
+        assert client.calls["get_dataset"] == 2
+
+    async def test_clear_cache_forces_refetch(self, use_client, clock, datasets_df):
+        client = use_client(datasets_df=datasets_df, datasets={"ds1": {"id": "ds1"}})
+
+        await server.get_all_datasets()
+        await server.get_dataset_info("ds1")
+        assert await server.clear_cache() == "Dataset cache cleared."
+        await server.get_all_datasets()
+        await server.get_dataset_info("ds1")
+
+        assert client.calls == {"get_all_datasets": 2, "get_dataset": 2}
+
+    def test_eviction_removes_oldest_entry(self, monkeypatch, use_client, clock):
+        monkeypatch.setattr(server, "DATASET_CACHE_MAXSIZE", 2)
+        client = use_client(datasets={"a": {"id": "a"}, "b": {"id": "b"}})
+
+        server.get_dataset_cached(client, "a")
+        clock[0] += 1
+        server.get_dataset_cached(client, "b")
+        # Refreshing "a" makes "b" the oldest entry
+        clock[0] += server.DATASET_CACHE_TTL_S + 1
+        server.get_dataset_cached(client, "a")
+        server.get_dataset_cached(client, "c")
+
+        assert list(server._dataset_cache) == ["a", "c"]
@@ -0,0 +1,38 @@
+"""
+Tests for formatting label search results.
+"""
+
+import pandas as pd
+
+from mcp_server import server
+
+
+class TestFormatSearchResults:
+    def test_truncates_long_strings(self):
+        results_df = pd.DataFrame(
+            {
+                "text": ["x" * 250, "short", None],
+                "mixed": pd.Series(["y" * 250, 3, {"k": 1}], dtype=object),
+                "number": [1, 2, 3],
+            }
+        )
+
+        columns, formatted = server.format_search_results(results_df)
+
+        assert list(columns) == ["text", "mixed", "number"]
+        assert f"text: {'x' * 200}...\n" in formatted[0]
+        assert f"mixed: {'y' * 200}...\n" in formatted[0]
+        assert "text: short\n" in formatted[1]
+        assert "mixed: 3\n" in formatted[1]
+        assert "mixed: {'k': 1}\n" in formatted[2]
+        # The caller's DataFrame is left untouched
+        assert len(results_df.loc[0, "text"]) == 250
+
+    def test_duplicate_column_labels(self):
+        results_df = pd.DataFrame([["x" * 250, "short"]], columns=["a", "a"])
+
+        columns, formatted = server.format_search_results(results_df)
+
+        assert list(columns) == ["a", "a"]
+        assert formatted[0] == f"\nResult 1:\na: {'x' * 200}...\na: short\n"
+        assert len(results_df.iloc[0, 0]) == 250
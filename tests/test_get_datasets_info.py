@@ -0,0 +1,39 @@
+"""
+Tests for fetching information about several datasets at once.
+"""
+
+import asyncio
+
+import pytest
+
+from mcp_server import server
+
+
+class TestGetDatasetsInfo:
+    async def test_found_missing_failing_and_duplicate_ids(self, use_client):
+        client = use_client(
+            datasets={
+                "ds1": {"id": "ds1", "name": "Cats"},
+                "broken": RuntimeError("boom"),
+            }
+        )
+
+        result = await server.get_datasets_info(["ds1", "missing", "broken", "ds1"])
+
+        assert result.startswith("Found 1 of 3 datasets:")
+        assert "ID: ds1\nName: Cats\n" in result
+        assert "No dataset found with ID: missing" in result
+        assert "Error getting dataset info for broken: boom" in result
+        assert result.count("ID: ds1") == 1
+        assert client.calls["get_dataset"] == 3
+
+    async def test_empty_ids(self, use_client):
+        use_client()
+
+        assert await server.get_datasets_info([]) == "No dataset IDs provided."
+
+    async def test_cancellation_propagates(self, use_client):
+        use_client(datasets={"ds1": asyncio.CancelledError()})
+
+        with pytest.raises(asyncio.CancelledError):
+            await server.get_datasets_info(["ds1"])
@@ -0,0 +1,36 @@
+"""
+Tests for configuring logging in the server entry point.
+"""
+
+import logging
+
+import pytest
+
+from mcp_server import server
+
+
+@pytest.fixture
+def run_main(monkeypatch):
+    """Run main() without starting the server and return the configured level."""
+    configured = {}
+    monkeypatch.setattr(server.mcp, "run", lambda transport: None)
+    monkeypatch.setattr(
+        logging, "basicConfig", lambda **kwargs: configured.update(kwargs)
+    )
+
+    def run(log_level):
+        monkeypatch.setenv("LOG_LEVEL", log_level)
+        server.main()
+        return configured["level"]
+
+    return run
+
+
+class TestLogLevel:
+    def test_level_name(self, run_main):
+        assert run_main("debug") == logging.DEBUG
+
+    @pytest.mark.parametrize("log_level", ["VERBOSE", "10"])
+    def test_invalid_level_falls_back_to_info(self, run_main, log_level, caplog):
+        assert run_main(log_level) == logging.INFO
+        assert f"Unknown LOG_LEVEL '{log_level}'" in caplog.text
@@ -0,0 +1,66 @@
+"""
+Tests for searching labels across all datasets.
+"""
+
+import asyncio
+
+import pandas as pd
+import pytest
+
+from mcp_server import server
+
+
+class TestSearchAcrossDatasets:
+    async def test_partial_failures_are_reported(self, use_client, datasets_df):
+        use_client(
+            datasets_df=datasets_df,
+            search_results={
+                "ds1": pd.DataFrame({"image_id": ["img1"]}),
+                "ds2": RuntimeError("timeout"),
+            },
+        )
+
+        result = await server.search_by_labels("cat")
+
+        assert "Found 1 images with label 'cat'" in result
+        assert "1 datasets could not be searched: ds2" in result
+        assert "dataset_id: ds1\nimage_id: img1\n" in result
+
+    async def test_all_failures_return_an_error(self, use_client, datasets_df):
+        use_client(
+            datasets_df=datasets_df,
+            search_results={
+                "ds1": RuntimeError("expired token"),
+                "ds2": RuntimeError("expired token"),
+            },
+        )
+
+        result = await server.search_by_labels("cat")
+
+        assert result.startswith("Error searching datasets by labels:")
+        assert "all 2 datasets" in result
+        assert "expired token" in result
+
+    async def test_falls_back_to_metadata_match(self, use_client, datasets_df):
+        use_client(
+            datasets_df=datasets_df,
+            search_results={"ds1": pd.DataFrame(), "ds2": pd.DataFrame()},
+        )
+
+        result = await server.search_by_labels("CATS")
+
+        assert result.startswith("Found 1 datasets matching 'CATS':")
+        assert "ID: ds1" in result
+        assert "could not be searched" not in result
+
+    async def test_cancellation_propagates(self, use_client, datasets_df):
+        use_client(
+            datasets_df=datasets_df,
+            search_results={
+                "ds1": pd.DataFrame({"image_id": ["img1"]}),
+                "ds2": asyncio.CancelledError(),
+            },
+        )
+
+        with pytest.raises(asyncio.CancelledError):
+            await server.search_by_labels("cat")